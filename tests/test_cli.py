@@ -0,0 +1,49 @@
+import sys
+
+import pytest
+
+from tyme.cli.cli import fast_parse_args, parse_args
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["status"],
+    ["stop"],
+    ["-c"],
+    ["--no-color", "status"],
+    ["-u", "me", "start", "cooking"],
+    ["--user", "me", "-c", "stop"],
+    ["-c", "--user", "me", "where", "cooking"],
+    ["start", "video games"],
+    ["make", "cooking"],
+    ["make", "-p", "/leisure/cooking"],
+    ["make", "/leisure/cooking", "--parents"],
+    ["log"],
+    ["log", "10"],
+    ["-u", "me", "log", "3"],
+    ["where", "cooking"],
+])
+def test_fast_parse_args_matches_parse_args(monkeypatch, argv):
+    monkeypatch.setattr(sys, "argv", ["tyme", *argv])
+
+    fast_args = fast_parse_args(argv)
+    assert fast_args is not None
+    assert vars(fast_args) == vars(parse_args())
+
+
+@pytest.mark.parametrize("argv", [
+    ["-h"],
+    ["start", "-h"],
+    ["start"],
+    ["start", "a", "b"],
+    ["make", "-q", "cooking"],
+    ["log", "x"],
+    ["log", "²"],
+    ["log", "-1"],
+    ["-u"],
+    ["--user=me", "status"],
+    ["stop", "-c"],
+    ["dance"],
+])
+def test_fast_parse_args_leaves_the_rest_to_argparse(argv):
+    assert fast_parse_args(argv) is None
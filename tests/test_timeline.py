@@ -0,0 +1,220 @@
+import json
+
+import hjson
+import pytest
+
+import tyme.timeline
+import tyme.utils as utils
+from tyme.timeline import Timeline, TimelineError
+
+
+@pytest.fixture(autouse=True)
+def timelines_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tyme.timeline, "TYME_TIMELINES_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Controls the time seen by timelines: set `clock.now` to a
+    "YYYY-MM-DD_HH:MM:SS" string.
+    """
+    class Clock:
+        now = "2020-01-01_00:00:00"
+
+    monkeypatch.setattr(utils, "utc_now", lambda: utils.parse(Clock.now))
+    return Clock
+
+
+def make_timeline():
+    activities = {"work": ["1", {"tyme": ["2", {}]}]}
+    timeline = {
+        "2020-01-01": [
+            {"id": "2", "name": "tyme", "start": "2020-01-01_10:00:00",
+             "end": "2020-01-01_11:00:00"},
+            {"id": "2", "name": "tyme", "start": "2020-01-01_23:00:00",
+             "end": "2020-01-02_01:00:00"},
+        ],
+        "2020-01-02": [
+            {"id": "2", "name": "tyme", "start": "2020-01-01_23:00:00",
+             "end": "2020-01-02_01:00:00", "previous": ""},
+            {"id": "1", "name": "work", "start": "2020-01-02_02:00:00"},
+        ],
+    }
+    return timeline, activities
+
+
+def test_save_and_reload(timelines_dir):
+    timeline, activities = make_timeline()
+    Timeline(user="me", timeline=timeline, activities=activities).save()
+
+    reloaded = Timeline(user="me")
+    assert dict(reloaded.timeline) == {
+        "2020-01-01": timeline["2020-01-01"],
+        "2020-01-02": timeline["2020-01-02"][1:],
+    }
+    assert reloaded.activities == activities
+    assert reloaded.current_activity()["name"] == "work"
+
+    # links to earlier activities survive being written out again
+    reloaded.new_activity("/leisure")
+    reloaded.save()
+    lines = (timelines_dir / "me.hjson").read_text().splitlines()
+    assert json.loads(lines[2]) == ["2020-01-02", timeline["2020-01-02"]]
+
+
+def test_unparsed_days_are_written_verbatim(timelines_dir):
+    old_day = ('["2020-01-01",[{"name":"tyme", "id":"2",'
+               '"start":"2020-01-01_10:00:00","end":"2020-01-01_11:00:00"}]]')
+    (timelines_dir / "me.hjson").write_text(
+        '{"activities":{"tyme":["2",{}]}}\n'
+        f"{old_day}\n"
+        '["2020-01-02",[{"id":"2","name":"tyme",'
+        '"start":"2020-01-02_10:00:00"}]]\n')
+
+    timeline = Timeline(user="me")
+    timeline.current_activity()["end"] = "2020-01-02_11:00:00"
+    timeline.new_activity("/leisure")
+    timeline.save()
+
+    lines = (timelines_dir / "me.hjson").read_text().splitlines()
+    assert lines[1] == old_day
+    assert json.loads(lines[2])[1][0]["end"] == "2020-01-02_11:00:00"
+
+
+def test_legacy_hjson_timeline_is_migrated(timelines_dir):
+    timeline, activities = make_timeline()
+    with open(timelines_dir / "me.hjson", "w") as timeline_file:
+        hjson.dump({"timeline": timeline, "activities": activities},
+                   timeline_file)
+
+    legacy = Timeline(user="me")
+    assert legacy.activity_path("tyme") == "/work/tyme"
+    assert legacy.current_activity()["name"] == "work"
+
+    legacy.new_activity("/leisure")
+    legacy.save()
+
+    header, *days = (timelines_dir / "me.hjson").read_text().splitlines()
+    assert set(json.loads(header)["activities"]) == {"work", "leisure"}
+    assert [json.loads(day) for day in days] == [
+        ["2020-01-01", timeline["2020-01-01"]],
+        ["2020-01-02", timeline["2020-01-02"]],
+    ]
+
+
+def test_done_fills_days_across_month_boundary(clock, timelines_dir):
+    timeline = Timeline(user="me", timeline={}, activities={})
+    timeline.new_activity("/sleep")
+
+    clock.now = "2020-01-31_23:00:00"
+    timeline.start("sleep")
+    clock.now = "2020-02-01_07:00:00"
+    timeline.done()
+
+    assert list(timeline.timeline) == ["2020-01-31", "2020-02-01"]
+    assert timeline.timeline["2020-01-31"][0]["end"] == "2020-02-01_07:00:00"
+    assert timeline.current_activity() is None
+
+    # the filled in day only holds a link to the activity
+    timeline.save()
+    last_line = (timelines_dir / "me.hjson").read_text().splitlines()[-1]
+    assert json.loads(last_line) == ["2020-02-01", [{
+        "id": timeline.activity_id("sleep"),
+        "name": "sleep",
+        "start": "2020-01-31_23:00:00",
+        "end": "2020-02-01_07:00:00",
+        "previous": "",
+    }]]
+
+
+def test_recent_activities_returns_newest_of_a_day(clock):
+    timeline = Timeline(user="me", timeline={}, activities={})
+    for activity in ("a", "b", "c"):
+        timeline.new_activity(f"/{activity}")
+
+    for time, activity in (("10", "a"), ("11", "b"), ("12", "c")):
+        clock.now = f"2020-01-01_{time}:00:00"
+        timeline.start(activity)
+
+    recent = timeline.recent_activities(num=2)
+    assert [a["name"] for a in recent["2020-01-01"]] == ["b", "c"]
+
+
+def test_done_after_activity_spanning_days_ended(clock):
+    timeline = Timeline(user="me", timeline={}, activities={})
+    timeline.new_activity("/sleep")
+
+    clock.now = "2020-01-31_23:00:00"
+    timeline.start("sleep")
+    clock.now = "2020-02-01_07:00:00"
+    timeline.done()
+
+    with pytest.raises(TimelineError):
+        timeline.done()
+
+
+def test_days_out_of_order_are_sorted(timelines_dir):
+    (timelines_dir / "me.hjson").write_text(
+        '{"activities":{"tyme":["2",{}]}}\n'
+        '["2020-01-02",[{"id":"2","name":"tyme",'
+        '"start":"2020-01-02_10:00:00"}]]\n'
+        '["2020-01-01",[{"id":"2","name":"tyme",'
+        '"start":"2020-01-01_10:00:00","end":"2020-01-01_11:00:00"}]]\n')
+
+    timeline = Timeline(user="me")
+    assert list(timeline.timeline) == ["2020-01-01", "2020-01-02"]
+    assert timeline.current_activity()["start"] == "2020-01-02_10:00:00"
+
+
+@pytest.mark.parametrize("line", [
+    '["2020-01-01",[{"id":"2","name":"tyme"}],"x"]',
+    '["2020-01-01",nope]',
+])
+def test_unreadable_day_raises_timeline_error(timelines_dir, line):
+    (timelines_dir / "me.hjson").write_text(
+        '{"activities":{"tyme":["2",{}]}}\n'
+        f"{line}\n")
+
+    with pytest.raises(TimelineError, match="me.hjson"):
+        Timeline(user="me").current_activity()
+
+
+def test_entries_missing_fields_load(timelines_dir):
+    (timelines_dir / "me.hjson").write_text(
+        '{"activities":{"tyme":["2",{}]}}\n'
+        '["2020-01-01",[{"name":"tyme","start":"2020-01-01_10:00:00"}]]\n')
+
+    timeline = Timeline(user="me")
+    assert timeline.current_activity() == {
+        "name": "tyme", "start": "2020-01-01_10:00:00"}
+
+
+def test_save_only_rewrites_changed_timelines(clock, timelines_dir):
+    timeline, activities = make_timeline()
+    Timeline(user="me", timeline=timeline, activities=activities).save()
+    timeline_file = timelines_dir / "me.hjson"
+
+    def rewritten(change):
+        # tyme skips blank lines when loading and never writes them, so a
+        # trailing one only survives if the file isn't rewritten
+        timeline_file.write_text(timeline_file.read_text() + "\n")
+        loaded = Timeline(user="me")
+        change(loaded)
+        loaded.save()
+        return not timeline_file.read_text().endswith("\n\n")
+
+    assert not rewritten(lambda t: t.current_activity())
+    assert rewritten(lambda t: t.new_activity("/leisure"))
+
+    clock.now = "2020-01-02_03:00:00"
+    assert rewritten(lambda t: t.start("tyme"))
+
+
+def test_failed_save_leaves_no_temporary_file(timelines_dir):
+    timeline = Timeline(user="me", timeline={}, activities={"bad": {1, 2}})
+
+    with pytest.raises(TypeError):
+        timeline.save()
+    assert list(timelines_dir.iterdir()) == []
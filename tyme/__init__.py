@@ -1,18 +1,29 @@
+import json
 import os
 
-import hjson
-
 from tyme.common import *
-from tyme.timeline import *
 
 
 __version__ = "0.1.6"
 
 
+def __getattr__(name):
+    """
+    Lazily exposes the timeline API (`tyme.Timeline`, etc.) so that importing
+    `tyme` alone, e.g. for `tyme --help`, doesn't load the timeline module.
+    """
+    if name in ("Timeline", "TimelineError"):
+        import tyme.timeline
+        return getattr(tyme.timeline, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def init():
     """
     Initializes tyme environment with .tyme folder and initial files.
     """
+    from tyme.timeline import Timeline
 
     if not os.path.isdir(TYME_DIR):
         os.mkdir(TYME_DIR)
@@ -25,6 +36,6 @@ def init():
         state = {'default_user': user}
 
         with open(TYME_STATE_FILE, 'w') as state_file:
-            hjson.dump(state, state_file)
+            json.dump(state, state_file)
 
         Timeline.make_empty(user)
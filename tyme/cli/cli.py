@@ -2,17 +2,81 @@
 Entrypoint for tyme cli
 """
 
-import argparse
+from __future__ import annotations
+
 import sys
+from types import SimpleNamespace
 
 import colorama
 
-import tyme.cli.render as render
-from tyme.timeline import Timeline, TimelineError
-from tyme import init as tyme_init
+
+def fast_parse_args(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Parses the usual shapes of tyme's arguments by hand, producing the same
+    namespace as `parse_args`. Anything out of the ordinary, such as `-h` or
+    a malformed command, is left to `parse_args` so that help and usage
+    errors look the same as always.
+
+    Args:
+        argv (list[str]): the arguments, without the program name
+
+    Returns:
+        SimpleNamespace | None: the parsed arguments, or `None` if
+            `parse_args` should be used instead
+    """
+    args = SimpleNamespace(user=None, no_color=False, command="status")
+
+    # global options come before the command
+    argv = list(argv)
+    while argv and argv[0].startswith("-"):
+        option = argv.pop(0)
+        if option in ("--no-color", "-c"):
+            args.no_color = True
+        elif option in ("--user", "-u") and argv \
+                and not argv[0].startswith("-"):
+            args.user = argv.pop(0)
+        else:
+            return None
+
+    if not argv:
+        return args
+
+    args.command, *rest = argv
+    options = [arg for arg in rest if arg.startswith("-")]
+    positionals = [arg for arg in rest if not arg.startswith("-")]
+
+    if args.command in ("stop", "status"):
+        if rest:
+            return None
+
+    elif args.command in ("start", "where"):
+        if options or len(positionals) != 1:
+            return None
+        args.activity = positionals[0]
+
+    elif args.command == "make":
+        if any(option not in ("--parents", "-p") for option in options) \
+                or len(positionals) != 1:
+            return None
+        args.parents = bool(options)
+        args.activity = positionals[0]
+
+    elif args.command == "log":
+        if options or len(positionals) > 1:
+            return None
+        if positionals and not positionals[0].isdecimal():
+            return None
+        args.number = int(positionals[0]) if positionals else 5
+
+    else:
+        return None
+
+    return args
 
 
 def parse_args():
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--user",
                         "-u",
@@ -28,7 +92,6 @@ def parse_args():
                         help="Disable colors globally.")
 
     commands = parser.add_subparsers(title="commands",
-                                     required=True,
                                      dest="command",
                                      help="For help on a specific command: "
                                           "`tyme [command] -h`.")
@@ -78,6 +141,9 @@ def parse_args():
     where.add_argument("activity",
                        metavar="Activity",
                        help="The activity whose path is to be determined.")
+
+    # running `tyme` on its own just reports the status
+    parser.set_defaults(command="status")
     return parser.parse_args()
 
 
@@ -86,8 +152,18 @@ def main():
     Entrypoint for tyme's cli.
     """
 
+    # the common invocations don't pay for building the argument parser
+    args = fast_parse_args(sys.argv[1:])
+    if args is None:
+        args = parse_args()
+
+    # imported here so that `--help` and usage errors don't pay for loading
+    # the timeline machinery
+    import tyme.cli.render as render
+    from tyme import init as tyme_init
+    from tyme.timeline import Timeline, TimelineError
+
     tyme_init()
-    args = parse_args()
 
     if args.no_color:
         colorama.init(autoreset=True, strip=True, convert=False)
@@ -4,12 +4,14 @@ These functions format and color any output that is sent to stdout.
 Any fancy output that you see from tyme has been generated here.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from colorama import Fore, Style
 
 import tyme.utils as utils
-from tyme.timeline import JSONActivities
+
+if TYPE_CHECKING:
+    from tyme.timeline import JSONActivities
 
 
 def start(activity: str,
@@ -206,7 +208,8 @@ def print_log(recent_activities: Dict[str, List[Dict[str, str]]]) -> None:
             print(Fore.BLUE + " V")
 
 
-def select_activity_path(activity: str, activities: JSONActivities) -> str:
+def select_activity_path(activity: str,
+                         activities: "JSONActivities") -> str:
     """
     Given a potentially non-absolute activity `activity`, find, the path it
     belongs to. If the activity is not absolute, then a series of interactive
@@ -1,28 +1,348 @@
 """
 Main API for interfacing with timeline internal representation. Timelines
-are .hjson files with two fields, "timeline" and "activities". The first is
-a mapping between days and lists of occurences of activities. The second is
-the activity hierarchy.
+are made up of two parts, "timeline" and "activities". The first is a mapping
+between days and lists of occurences of activities. The second is the
+activity hierarchy.
+
+Timelines are stored in .hjson files as json lines: the first line is an
+object holding the activity hierarchy, and every following line is a
+`[day, occurences]` pair, in chronological order. This lets a day's
+occurences be parsed only when they are needed (see `LazyTimeline`). Older
+timelines stored as a single json or hjson object are still accepted when
+loading, and are rewritten as json lines the next time they are saved.
 """
 
-import uuid
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from __future__ import annotations
 
-import hjson
+import functools
+import json
+import os
+import sys
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING
 
 import tyme.utils as utils
 from tyme.common import *
 
+# annotations are never evaluated at runtime, so the types they use are only
+# needed when type checking
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import IO, Any, Iterator, Mapping, Optional, Union
 
-JSONTimeline = Dict[str, List[Dict[str, str]]]
-JSONActivities = Dict[str, Tuple[str, "JSONActivities"]]
+    JSONTimeline = dict[str, list[dict[str, str]]]
+    JSONActivities = dict[str, tuple[str, "JSONActivities"]]
 
 
 class TimelineError(Exception):
     pass
 
 
+def _load(file: IO[str]) -> Any:
+    """
+    Loads a json object from `file`, falling back to the much slower hjson
+    parser if the file isn't strict json (e.g. it was edited by hand).
+
+    Args:
+        file (IO[str]): the open file to be loaded
+
+    Returns:
+        The json object contained in `file`
+    """
+    try:
+        return json.load(file)
+    except json.JSONDecodeError:
+        import hjson
+
+        file.seek(0)
+        return hjson.load(file)
+
+
+def _intern_entries(entries: list[dict[str, str]]) -> list[dict[str, str]]:
+    """
+    Interns the ids and names of a day's timeline entries, which are repeated
+    throughout a timeline, so every occurrence shares a single string object.
+    `entries` is modified in place.
+
+    Args:
+        entries (list[dict[str, str]]): the timeline entries of a day
+
+    Returns:
+        list[dict[str, str]]: the same entries, with their strings interned
+    """
+    intern = sys.intern
+    for entry in entries:
+        # hand-edited entries might be missing fields
+        if "id" in entry:
+            entry["id"] = intern(entry["id"])
+        if "name" in entry:
+            entry["name"] = intern(entry["name"])
+
+    return entries
+
+
+def _intern_activities(activities: JSONActivities) -> JSONActivities:
+    """
+    Interns the names and ids in an activity hierarchy, which are repeated
+    throughout the timeline. `activities` is modified in place.
+
+    Args:
+        activities (JSONActivities): the activity hierarchy
+
+    Returns:
+        JSONActivities: the same hierarchy, with its strings interned
+    """
+    intern = sys.intern
+
+    stack = [activities]
+    while stack:
+        category = stack.pop()
+        interned: dict[str, Any] = {
+            intern(name): [intern(activity_id), children]
+            for name, (activity_id, children) in category.items()}
+
+        category.clear()
+        category.update(interned)
+        stack.extend(children for _, children in interned.values())
+
+    return activities
+
+
+class LazyTimeline(MutableMapping):
+    """
+    A mapping between days and lists of occurences of activities, just like a
+    JSONTimeline, except that the occurences of a day are only parsed when
+    that day is first accessed. Days that are never accessed are written back
+    out exactly as they were read.
+
+    When an activity spans several days, every day after the first holds a
+    link to it: a copy of the activity with a "previous" field. Links are
+    kept apart from the real occurences, so a day only maps to the
+    activities that were started on it.
+
+    Args:
+        days (Optional[dict[str, Union[str, list[dict[str, str]]]]]):
+            a mapping from days to either their occurences, or the raw json
+            of their occurences if they haven't been parsed yet
+        source (str): where the days were read from, for error messages
+    """
+
+    def __init__(self,
+                 days: Optional[dict[str, Union[str,
+                                                list[dict[str, str]]]]] = None,
+                 source: str = "the timeline file") -> None:
+        self._source = source
+
+        # copied, as splitting out the links would otherwise modify `days`
+        self._days = {} if days is None else dict(days)
+
+        # day -> the links on that day, for days that have been parsed
+        self._links: dict[str, list[dict[str, str]]] = {}
+
+        for day, entries in self._days.items():
+            if not isinstance(entries, str):
+                self._days[day] = self._split_links(day, entries)
+
+    def _split_links(self,
+                     day: str,
+                     entries: list[dict[str, str]]) -> list[dict[str, str]]:
+        """
+        Records the links among `entries` as the links of `day`, and returns
+        the remaining, real, occurences. Links always come before the real
+        occurences of a day.
+
+        Args:
+            day (str): the day that `entries` belong to
+            entries (list[dict[str, str]]): the entries of `day`
+
+        Returns:
+            list[dict[str, str]]: the real occurences in `entries`
+        """
+        num_links = 0
+        while num_links < len(entries) and "previous" in entries[num_links]:
+            num_links += 1
+
+        if num_links == 0:
+            self._links.pop(day, None)
+            return entries
+
+        self._links[day] = entries[:num_links]
+        return entries[num_links:]
+
+    def __getitem__(self, day: str) -> list[dict[str, str]]:
+        entries = self._days[day]
+        if isinstance(entries, str):
+            try:
+                parsed = json.loads(entries)
+            except ValueError:
+                raise TimelineError(f"Couldn't read the day {day!r} in "
+                                    f"{self._source}.") from None
+
+            entries = self._days[day] = self._split_links(
+                day, _intern_entries(parsed))
+
+        return entries
+
+    def __setitem__(self, day: str, entries: list[dict[str, str]]) -> None:
+        self._days[day] = self._split_links(day, entries)
+
+    def __delitem__(self, day: str) -> None:
+        del self._days[day]
+        self._links.pop(day, None)
+
+    def __contains__(self, day: object) -> bool:
+        # overridden so that membership tests don't parse the day
+        return day in self._days
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._days)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._days)
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def sort(self) -> None:
+        """
+        Puts the days in chronological order, without parsing any of them.
+        """
+        self._days = dict(sorted(self._days.items(), key=lambda kv: kv[0]))
+
+    def write(self, file: IO[str]) -> None:
+        """
+        Writes each day to `file` as a `[day, occurences]` json line.
+
+        Args:
+            file (IO[str]): the file to write to
+        """
+        for day, entries in self._days.items():
+            if not isinstance(entries, str):
+                entries = json.dumps(self._links.get(day, []) + entries,
+                                     separators=(",", ":"))
+
+            file.write(f"[{json.dumps(day)},{entries}]\n")
+
+    @staticmethod
+    def read(file: IO[str]) -> LazyTimeline:
+        """
+        Reads the `[day, occurences]` json lines in `file`. Only the days are
+        extracted, their occurences are left unparsed. Blank lines are
+        skipped, and lines that weren't written by tyme (e.g. edited by hand)
+        are parsed in full.
+
+        Args:
+            file (IO[str]): the file to read from
+
+        Returns:
+            LazyTimeline: the days read from `file`
+
+        Raises:
+            TimelineError: if a line isn't a `[day, occurences]` pair
+        """
+        source = getattr(file, "name", "the timeline file")
+        days: dict[str, Union[str, list[dict[str, str]]]] = {}
+
+        # tyme writes the days in order, but they might have been reordered
+        # by hand
+        in_order = True
+        previous_day = ""
+
+        for line in file:
+            if line.isspace():
+                continue
+
+            # lines written by tyme look like ["YYYY-MM-DD",[...]]
+            day_end = line.find('",', 2)
+            entries_end = line.rfind("]")
+            if line.startswith('["') and day_end != -1 \
+                    and line.startswith("[", day_end + 2) \
+                    and entries_end > day_end + 2:
+                day = sys.intern(line[2:day_end])
+                days[day] = line[day_end + 2:entries_end]
+
+            else:
+                try:
+                    day, entries = json.loads(line)
+                    day = sys.intern(day)
+                except (ValueError, TypeError):
+                    raise TimelineError(f"Couldn't read the line "
+                                        f"{line.strip()!r} in {source}.") \
+                        from None
+
+                days[day] = _intern_entries(entries)
+
+            if day < previous_day:
+                in_order = False
+            previous_day = day
+
+        timeline = LazyTimeline(days, source=str(source))
+        if not in_order:
+            timeline.sort()
+
+        return timeline
+
+
+def _load_user_state(file: IO[str]) -> Any:
+    """
+    Loads a user's timeline from `file`. This will contain two fields
+    "timeline" and "activities", a LazyTimeline and a JSONActivities object
+    respectively.
+
+    Args:
+        file (IO[str]): the open timeline file to be loaded
+
+    Returns:
+        The json object corresponding to a users timeline
+    """
+    try:
+        user_state = json.loads(file.readline())
+    except json.JSONDecodeError:
+        user_state = None
+
+    if isinstance(user_state, dict) and "timeline" not in user_state:
+        timeline = LazyTimeline.read(file)
+
+    else:
+        # an older timeline, stored as a single json or hjson object, whose
+        # days might not be in chronological order
+        file.seek(0)
+        user_state = _load(file)
+        timeline = LazyTimeline({
+            sys.intern(day): _intern_entries(entries)
+            for day, entries in sorted(user_state["timeline"].items())
+        })
+
+    return {"timeline": timeline,
+            "activities": _intern_activities(user_state["activities"])}
+
+
+def _timeline_path(user: str) -> Path:
+    """
+    Returns the location of the timeline file of user `user`.
+
+    Args:
+        user (str): the user whose timeline file is desired
+
+    Returns:
+        Path: the location of the timeline file of `user`
+    """
+    return (TYME_TIMELINES_DIR / user).with_suffix(".hjson")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_user() -> str:
+    """
+    Reads the default user from the state file. The result is cached for the
+    lifetime of the process.
+
+    Returns:
+        str: the name of the default user
+    """
+    with open(TYME_STATE_FILE) as state_file:
+        return _load(state_file)["default_user"]
+
+
 class Timeline:
     """
     Interface to modify timeline data. Create new activity categories, start
@@ -31,7 +351,7 @@ class Timeline:
 
     def __init__(self,
                  user: str = None,
-                 timeline: JSONTimeline = None,
+                 timeline: Optional[Mapping[str, list[dict[str, str]]]] = None,
                  activities: JSONActivities = None) -> None:
         """
         Creates a timeline with a user. If a user is not specified, then
@@ -40,21 +360,32 @@ class Timeline:
 
         Args:
             user (str): the user whose timeline is being loaded/created
-            timeline (Optional[JSONTimeline]):
-                a timeline to use if `user` doesn't yet exist
+            timeline (Optional[Mapping[str, list[dict[str, str]]]]):
+                a timeline to use if `user` doesn't yet exist. If this is a
+                LazyTimeline, its days must already be in chronological order
             activities (Optional[JSONActivities]):
                 an activity hierarchy to use if `user` doesn't yet exist
         """
         if user is None:
             user = Timeline.default_user()
         self.user = user
+        self._timeline_path = _timeline_path(user)
+
+        self.timeline: LazyTimeline
 
         if timeline is not None and activities is not None:
+            # days are kept in chronological order, so the most recent day
+            # is the last one. Days are ISO dates, so sorting them lexically
+            # is enough.
+            if not isinstance(timeline, LazyTimeline):
+                timeline = LazyTimeline(dict(sorted(timeline.items())))
+
             self.timeline = timeline
             self.activities = activities
 
         elif timeline is None and activities is None:
-            user_state = Timeline.load_user_timeline(user)
+            with open(self._timeline_path) as timeline_file:
+                user_state = _load_user_state(timeline_file)
             self.timeline = user_state["timeline"]
             self.activities = user_state["activities"]
 
@@ -62,7 +393,24 @@ class Timeline:
             raise ValueError(
                 "both timeline and activies must have values or be None")
 
-    def recent_activities(self, num: int) -> Dict[str, List[Dict[str, str]]]:
+        # whether there are changes that haven't been saved yet. A timeline
+        # that was passed in rather than loaded doesn't exist on disk yet.
+        self._dirty = timeline is not None
+
+        # name -> id/path lookups, built lazily from `self.activities`
+        self._id_index: Optional[dict[str, str]] = None
+        self._path_index: Optional[dict[str, str]] = None
+
+    def _last_day(self) -> Optional[str]:
+        """
+        Returns the most recent day in the timeline, or `None` if it is empty.
+
+        Returns:
+            Optional[str]: the most recent day in the timeline
+        """
+        return next(reversed(self.timeline), None)
+
+    def recent_activities(self, num: int) -> dict[str, list[dict[str, str]]]:
         """
         Returns the `num` most recent activities. The returned object is a
         dictionary with dates as keys and lists of activities as values. Each
@@ -73,29 +421,32 @@ class Timeline:
             num (int): the number of activities to return
 
         Returns:
-            Dict[str, List[Dict[str, str]]]: the `num` most recent activities
+            dict[str, list[dict[str, str]]]: the `num` most recent activities
         """
 
         # `activities`: a map from day (str) to a list of timeline entries
-        activities: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        activities: dict[str, list[dict[str, str]]] = {}
 
         # Grab the most recent `num` events
-        for day in sorted(self.timeline.keys(), reverse=True):
-            for activity in self.timeline[day]:
-                # not a real activity, but a link to one on a previous day
-                if "previous" in activity:
-                    continue
-
-                activities[day].append(activity)
+        for day in reversed(self.timeline):
+            for activity in reversed(self.timeline[day]):
+                activities.setdefault(day, []).append(activity)
 
                 num -= 1
                 if num == 0:
-                    return dict(activities)
+                    break
+
+            if num == 0:
+                break
+
+        # each day was collected newest first, but is returned oldest first
+        for day_activities in activities.values():
+            day_activities.reverse()
 
-        return dict(activities)
+        return activities
 
     def start(self,
-              activity: str) -> Optional[Tuple[utils.Timestamp, utils.Timestamp, str]]:
+              activity: str) -> Optional[tuple[utils.Timestamp, utils.Timestamp, str]]:
         """
         Completes any ongoing activity and starts a new one.
 
@@ -103,7 +454,7 @@ class Timeline:
             activity (str): the activity to be started
 
         Returns:
-            Optional[Tuple[utils.Timestamp, utils.Timestamp, str]]:
+            Optional[tuple[utils.Timestamp, utils.Timestamp, str]]:
                 information about the activity that was completed in order to
                 start this one: start/end/name. If there was no previous activity, this is
                 `None`.
@@ -112,75 +463,99 @@ class Timeline:
         if activity_id is None:
             raise TimelineError(f"The activity '{activity}' does not exist.")
 
-        activity_completed: Optional[Tuple[utils.Timestamp,
+        activity_completed: Optional[tuple[utils.Timestamp,
                                            utils.Timestamp, str]] = None
         if self.current_activity() is not None:
             activity_completed = self.done()
 
         start_timestamp = utils.utc_now()
-        if start_timestamp.date_str not in self.timeline:
-            self.timeline[start_timestamp.date_str] = []
+        start_date = start_timestamp.date_str
 
-        self.timeline[start_timestamp.date_str].append({
+        last_day = self._last_day()
+        self.timeline.setdefault(start_date, []).append({
             "id": activity_id,
             "name": activity,
             "start": start_timestamp.datetime_str
         })
+        self._dirty = True
+
+        # only possible if the clock went backwards, keep the days in order
+        if last_day is not None and start_date < last_day:
+            self.timeline.sort()
 
         return activity_completed
 
-    def done(self) -> Tuple[utils.Timestamp, utils.Timestamp, str]:
+    def done(self) -> tuple[utils.Timestamp, utils.Timestamp, str]:
         """
         Completes the ongoing activity. There must be an ongoing activity for
         this method to be called successfully.
 
         Returns:
-            Tuple[utils.Timestamp, utils.Timestamp, str]:
+            tuple[utils.Timestamp, utils.Timestamp, str]:
                 information about the activity that was completed:
                 start/end/name.
         """
         # grab the most recent day and the most recent activity on that day
-        last_activity = self.timeline[sorted(self.timeline.keys())[-1]][-1]
+        last_day = self._last_day()
+
+        # the last day might only hold links to an activity that has ended
+        if last_day is None or not self.timeline[last_day]:
+            raise TimelineError("There is no ongoing activity.")
 
-        start_timestamp = utils.parse(last_activity["start"])
+        last_activity = self.timeline[last_day][-1]
+
+        start_str = last_activity["start"]
+        start_timestamp = utils.parse(start_str)
         end_timestamp = utils.utc_now()
 
-        last_activity["end"] = end_timestamp.datetime_str
+        start_date = start_timestamp.date_str
+        end_date = end_timestamp.date_str
+        end_str = end_timestamp.datetime_str
+
+        last_activity["end"] = end_str
+        self._dirty = True
 
         # quickly check that start time is not in the future.
-        if start_timestamp.date_str > end_timestamp.date_str:
+        if start_date > end_date:
             raise TimelineError("Finishing activity before it was started. "
                                 "Maybe system clock is wrong?")
 
         # fill any days in between the start time and today
-        if start_timestamp.date_str != end_timestamp.date_str:
-            num_days = end_timestamp.datetime.day - start_timestamp.datetime.day
+        if start_date != end_date:
+            num_days = (end_timestamp.datetime.date() -
+                        start_timestamp.datetime.date()).days
+
+            # each day gets its own copy of this link to the activity
+            link = {
+                "id": last_activity["id"],
+                "name": last_activity["name"],
+                "start": start_str,
+                "end": end_str,
+                "previous": "",
+            }
             for offset in range(1, num_days + 1):
                 day = utils.offset_day(start_timestamp, days_offset=offset)
-                self.timeline[day] = [
-                    {
-                        "id": last_activity["id"],
-                        "name": last_activity["name"],
-                        "start": last_activity["start"],
-                        "end": end_timestamp.datetime_str,
-                        "previous": "",
-                    }
-                ]
+                # these days all come after the last day, so the days
+                # stay in order
+                self.timeline[day] = [link.copy()]
 
         return (start_timestamp, end_timestamp, last_activity["name"])
 
-    def current_activity(self) -> Optional[Dict[str, str]]:
+    def current_activity(self) -> Optional[dict[str, str]]:
         """
         Returns the ongoing activity if there is one. Returns `None` otherwise.
 
         Returns:
-            Optional[Dict[str, str]]:
+            Optional[dict[str, str]]:
                 The literal JSON that represents this activity.
         """
-        if self.timeline == {}:
+        last_day = self._last_day()
+
+        # the last day might only hold links to an activity that has ended
+        if last_day is None or not self.timeline[last_day]:
             return None
 
-        last_activity = self.timeline[sorted(self.timeline.keys())[-1]][-1]
+        last_activity = self.timeline[last_day][-1]
 
         if "end" in last_activity:
             return None
@@ -189,17 +564,33 @@ class Timeline:
 
     def save(self) -> str:
         """
-        Saves this timeline to the default location:
+        Saves this timeline to the default location. Nothing is written if
+        the timeline hasn't changed since it was loaded or last saved.
 
         Returns:
             str: the location of the .hjson file that was saved.
         """
-        timeline_file = (TYME_TIMELINES_DIR / self.user).with_suffix(".hjson")
-
-        with open(timeline_file, "w") as timeline:
-            hjson.dump({"timeline": self.timeline,
-                        "activities": self.activities},
-                       timeline)
+        timeline_file = self._timeline_path
+        if not self._dirty:
+            return str(timeline_file)
+
+        # write to a temporary file first, so that a crash midway through
+        # can't leave a truncated timeline behind
+        tmp_file = timeline_file.with_suffix(".hjson.tmp")
+        try:
+            with open(tmp_file, "w", buffering=1 << 16) as timeline:
+                json.dump({"activities": self.activities},
+                          timeline,
+                          separators=(",", ":"))
+                timeline.write("\n")
+                self.timeline.write(timeline)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        os.replace(tmp_file, timeline_file)
+
+        self._dirty = False
         return str(timeline_file)
 
     def new_activity(self, activity, parents=False):
@@ -220,20 +611,69 @@ class Timeline:
 
         *path, new_activity = activity_path
 
+        # imported here as creating activities is rare
+        import uuid
+
+        # read the random bytes for every id that might be needed at once,
+        # rather than once per `uuid.uuid4()` call
+        random_bytes = os.urandom(16 * (len(path) + 1))
+        ids = (str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+               for i in range(0, len(random_bytes), 16))
+
         current_category = self.activities
         for category in path:
-            if category not in current_category:
+            entry = current_category.get(category)
+            if entry is None:
                 if not parents:
                     raise ValueError(f"the activity '{category}' within "
                                      f"'{activity}' does not exist")
                 else:
                     # just make a new activity.
-                    current_category[category] = (str(uuid.uuid4()), {})
+                    entry = current_category[category] = (next(ids), {})
 
             # [1] is because the first element in each activity is a uuid
-            current_category = current_category[category][1]
+            current_category = entry[1]
+
+        current_category[new_activity] = (next(ids), {})
+
+        self._dirty = True
+
+        # the hierarchy changed, so the lookups need to be rebuilt
+        self._id_index = None
+        self._path_index = None
 
-        current_category[new_activity] = (str(uuid.uuid4()), {})
+    def _build_index(self) -> tuple[dict[str, str], dict[str, str]]:
+        """
+        Walks the activity hierarchy once, recording the id and absolute path
+        of every activity. If several activities share a name, the first one
+        found in a depth-first, pre-order walk wins.
+
+        Returns:
+            tuple[dict[str, str], dict[str, str]]:
+                the name -> id and name -> path lookups
+        """
+        id_index: dict[str, str] = {}
+        path_index: dict[str, str] = {}
+
+        # entries are (name, id, children, parent path), pushed in reverse so
+        # that siblings are popped in order
+        stack = [(name, activity_id, children, "")
+                 for name, (activity_id, children)
+                 in reversed(list(self.activities.items()))]
+
+        while stack:
+            name, activity_id, children, path = stack.pop()
+            path = f"{path}/{name}"
+
+            if name not in id_index:
+                id_index[name] = activity_id
+                path_index[name] = path
+
+            stack.extend((child, child_id, grandchildren, path)
+                         for child, (child_id, grandchildren)
+                         in reversed(list(children.items())))
+
+        return id_index, path_index
 
     def activity_path(self, activity: str) -> Optional[str]:
         """
@@ -247,22 +687,10 @@ class Timeline:
             Optional[str]: the absolute path leading to `activity` if there
                 is one
         """
-        def search(category, path):
-            """
-            Returns the path if activity is under the sub-tree `category`
-            otherwise returns None
-            """
-            for name, (_, children) in category.items():
-                if name == activity:
-                    return f"{path}/{activity}"
-
-                potential_path = search(children, f"{path}/{name}")
-                if potential_path is not None:
-                    return potential_path
-
-            return None
+        if self._path_index is None:
+            self._id_index, self._path_index = self._build_index()
 
-        return search(self.activities, "")
+        return self._path_index.get(activity)
 
     def activity_id(self, activity: str) -> Optional[str]:
         """
@@ -276,22 +704,10 @@ class Timeline:
             Optional[str]: the uuid4 corresponding to `activity` if there is
                 one
         """
-        def search(category: JSONActivities) -> Optional[str]:
-            """
-            Returns the id of `activity` if it is under the sub-tree `category`
-            otherwise returns None
-            """
-            for name, (activity_id, children) in category.items():
-                if name == activity:
-                    return activity_id
-
-                potential_id = search(children)
-                if potential_id is not None:
-                    return potential_id
-
-            return None
+        if self._id_index is None:
+            self._id_index, self._path_index = self._build_index()
 
-        return search(self.activities)
+        return self._id_index.get(activity)
 
     @staticmethod
     def make_empty(user: str) -> None:
@@ -311,15 +727,14 @@ class Timeline:
         Returns:
             str: the name of the default user
         """
-        with open(TYME_STATE_FILE) as state_file:
-            return hjson.load(state_file)["default_user"]
+        return _default_user()
 
     @staticmethod
     def load_user_timeline(user: str) -> Any:
         """
         Loads and returns the json object corresponding to a users timeline.
         This will contain two fields "timeline" and "activites", each
-        corresponding to a JSONTimeline and JSONActivities object respectively.
+        corresponding to a LazyTimeline and JSONActivities object respectively.
 
         Args:
             str: the user whose timeline is desired
@@ -327,6 +742,5 @@ class Timeline:
         Returns:
             The json object corresponding to a users timeline
         """
-        user_timeline_path = (TYME_TIMELINES_DIR / user).with_suffix(".hjson")
-        with open(user_timeline_path) as timeline:
-            return hjson.load(timeline)
+        with open(_timeline_path(user)) as timeline:
+            return _load_user_state(timeline)